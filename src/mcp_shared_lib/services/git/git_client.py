@@ -1,7 +1,9 @@
 """Git command execution client with error handling."""
 
 import asyncio
-import json
+import contextlib
+import re
+from collections import defaultdict
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
@@ -11,6 +13,39 @@ from mcp_shared_lib.utils import logging_service
 if TYPE_CHECKING:
     from fastmcp import Context  # unused: keep for TYPE_CHECKING
 
+# All commands issued by the client are read-only, so git must not take the
+# optional index lock (e.g. to refresh stat info during ``git status``).
+GIT_READ_ARGS = ("git", "--no-optional-locks")
+
+# Upper bound on git processes a single fan-out call keeps running at once.
+MAX_CONCURRENT_COMMANDS = 8
+
+# Keys of the commit dicts returned by get_unpushed_commits, in log format order.
+_COMMIT_FIELDS = ("sha", "message", "author", "email", "date")
+
+# Start of each per-file section in ``git diff`` patch output. Hunk lines
+# always begin with a prefix character, so this can't match diff content.
+_DIFF_SECTION_RE = re.compile(r"^(?=diff --(?:git|cc|combined) )", re.MULTILINE)
+
+# Notes ``git diff --cached`` prints for unmerged paths, which have no section
+_UNMERGED_NOTE_RE = re.compile(r"^\* Unmerged path .*\n?", re.MULTILINE)
+
+# Extended header lines naming the post-image path of a rename or copy
+_DIFF_TARGET_PREFIXES = ("rename to ", "copy to ")
+
+# Escapes git uses in C-quoted paths, other than octal byte escapes
+_C_ESCAPES = {
+    "a": b"\a",
+    "b": b"\b",
+    "f": b"\f",
+    "n": b"\n",
+    "r": b"\r",
+    "t": b"\t",
+    "v": b"\v",
+    '"': b'"',
+    "\\": b"\\",
+}
+
 
 class GitCommandError(Exception):
     """Exception raised when git command fails."""
@@ -39,7 +74,7 @@ class GitClient:
         ctx: Optional["Context"] = None,
     ) -> str:
         """Execute a git command in the given repository."""
-        full_command = ["git", "-C", str(repo_path)] + command
+        full_command = [*GIT_READ_ARGS, "-C", str(repo_path), *command]
 
         if ctx:
             await ctx.debug(f"Executing git command: {' '.join(full_command)}")
@@ -52,9 +87,17 @@ class GitClient:
                 cwd=repo_path,
             )
 
-            stdout, stderr = await result.communicate()
-            stdout_str = stdout.decode("utf-8").strip()
-            stderr_str = stderr.decode("utf-8").strip()
+            try:
+                stdout, stderr = await result.communicate()
+            except asyncio.CancelledError:
+                # Don't leave the git process running after the caller gave up;
+                # it may already have exited, so a missing process is fine
+                with contextlib.suppress(ProcessLookupError):
+                    result.kill()
+                await result.wait()
+                raise
+            stdout_str = stdout.decode("utf-8", errors="replace").strip()
+            stderr_str = stderr.decode("utf-8", errors="replace").strip()
 
             if check and result.returncode != 0:
                 if ctx:
@@ -80,6 +123,37 @@ class GitClient:
                 await ctx.error(f"Unexpected error executing git command: {str(e)}")
             raise GitCommandError(full_command, -1, str(e)) from e
 
+    async def _gather_commands(
+        self,
+        repo_path: Path,
+        commands: list[list[str]],
+        ctx: Optional["Context"] = None,
+    ) -> list[str | GitCommandError]:
+        """Run independent git commands concurrently.
+
+        Args:
+            repo_path: Path to git repository
+            commands: Git commands to run (without the leading ``git``)
+            ctx: Context for logging
+
+        Returns:
+            One entry per command, in order: its output, or the GitCommandError
+            it raised.
+        """
+        results = await asyncio.gather(
+            *(
+                self.execute_command(repo_path, command, ctx=ctx)
+                for command in commands
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(
+                result, GitCommandError
+            ):
+                raise result
+        return list(results)  # type: ignore[arg-type]
+
     async def get_status(
         self, repo_path: Path, ctx: Optional["Context"] = None
     ) -> dict[str, Any]:
@@ -88,7 +162,14 @@ class GitClient:
             await ctx.debug("Getting git status (porcelain format)")
 
         # Get porcelain status for parsing - DON'T strip the output as leading spaces are significant
-        full_command = ["git", "-C", str(repo_path), "status", "--porcelain=v1"]
+        full_command = [
+            *GIT_READ_ARGS,
+            "-C",
+            str(repo_path),
+            "status",
+            "--porcelain=v1",
+            "-z",
+        ]
 
         if ctx:
             await ctx.debug(f"Executing git command: {' '.join(full_command)}")
@@ -103,10 +184,8 @@ class GitClient:
 
             stdout, stderr = await result.communicate()
             # Don't strip the output - leading spaces are significant for git status parsing
-            status_output = stdout.decode("utf-8").rstrip(
-                "\n"
-            )  # Only remove trailing newlines
-            stderr_str = stderr.decode("utf-8").strip()
+            status_output = stdout.decode("utf-8", errors="replace")
+            stderr_str = stderr.decode("utf-8", errors="replace").strip()
 
             if result.returncode != 0:
                 if ctx:
@@ -128,51 +207,28 @@ class GitClient:
                 await ctx.error(f"Unexpected error executing git command: {str(e)}")
             raise GitCommandError(full_command, -1, str(e)) from e
 
+        # Entries are "XY path", NUL-terminated and never quoted. Renames and
+        # copies are followed by an extra entry holding the original path.
+        # X = index status (staged), Y = working tree status (unstaged)
         files = []
-        for line in status_output.split("\n"):
-            if line.strip() and len(line) >= 2:
-                # Git status porcelain format: XY filename
-                # X = index status (staged), Y = working tree status (unstaged)
-                # For unstaged files: " M filename" (space + M)
-                # For staged files: "M  filename" (M + space)
-                # For both: "MM filename" (M + M)
-
-                # Handle different line lengths - some git versions may have different formats
-                if len(line) >= 3 and line[2] == " ":
-                    # Standard format: "XY filename" where position 2 is space
-                    index_status = line[0] if line[0] != " " else None
-                    working_status = line[1] if line[1] != " " else None
-                    filename_start = 3
-                elif len(line) >= 2:
-                    # Compact format: "XYfilename" where there's no space separator
-                    # This shouldn't happen with --porcelain=v1, but handle it just in case
-                    index_status = line[0] if line[0] != " " else None
-                    working_status = line[1] if line[1] != " " else None
-                    filename_start = 2
-                else:
-                    continue
-
-                # Handle rename case: status code 'R' has format "R  old -> new"
-                if index_status == "R" or working_status == "R":
-                    # For rename, filename is after '-> '
-                    arrow_pos = line.find("->")
-                    if arrow_pos != -1:
-                        filename = line[arrow_pos + 3 :].strip()
-                    else:
-                        filename = line[filename_start:].strip()
-                else:
-                    filename = line[filename_start:].strip()
-
-                files.append(
-                    {
-                        "filename": filename,
-                        "index_status": index_status,
-                        "working_status": working_status,
-                        "status_code": line[
-                            :2
-                        ],  # Keep the full two-character status code
-                    }
-                )
+        entries = iter(status_output.split("\0"))
+        for entry in entries:
+            if len(entry) < 4:
+                continue
+
+            index_status = entry[0] if entry[0] != " " else None
+            working_status = entry[1] if entry[1] != " " else None
+            if index_status in ("R", "C") or working_status in ("R", "C"):
+                next(entries, None)
+
+            files.append(
+                {
+                    "filename": entry[3:],
+                    "index_status": index_status,
+                    "working_status": working_status,
+                    "status_code": entry[:2],  # Keep the full two-character code
+                }
+            )
 
         if ctx:
             await ctx.debug(f"Parsed {len(files)} file status entries")
@@ -206,6 +262,88 @@ class GitClient:
 
         return diff_output
 
+    async def get_file_diffs(
+        self,
+        repo_path: Path,
+        file_paths: list[str],
+        staged: bool = False,
+        ctx: Optional["Context"] = None,
+    ) -> dict[str, str]:
+        """Get diffs for several files concurrently.
+
+        Args:
+            repo_path: Path to git repository
+            file_paths: Files to diff
+            staged: If True, diff the index instead of the working tree
+            ctx: Context for logging
+
+        Returns:
+            Mapping of file path to its diff output.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_COMMANDS)
+
+        async def diff_one(file_path: str) -> str:
+            async with semaphore:
+                return await self.get_diff(
+                    repo_path, staged=staged, file_path=file_path, ctx=ctx
+                )
+
+        tasks = [asyncio.ensure_future(diff_one(path)) for path in file_paths]
+        try:
+            diffs = await asyncio.gather(*tasks)
+        except BaseException:
+            # Stop the remaining diffs instead of leaving them to spawn git
+            # processes in the background
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return dict(zip(file_paths, diffs))
+
+    async def get_all_diffs(
+        self,
+        repo_path: Path,
+        staged: bool = False,
+        ctx: Optional["Context"] = None,
+    ) -> dict[str, str]:
+        """Get the diff of every changed file from a single git diff.
+
+        Args:
+            repo_path: Path to git repository
+            staged: If True, diff the index instead of the working tree
+            ctx: Context for logging
+
+        Returns:
+            Mapping of file path (the post-image path for renames) to its diff.
+        """
+        # Pin the header format: no color or external diff drivers, and the
+        # default a/ b/ prefixes whatever diff.noprefix/mnemonicPrefix say
+        command = [
+            "diff",
+            "--no-color",
+            "--no-ext-diff",
+            "--src-prefix=a/",
+            "--dst-prefix=b/",
+        ]
+        if staged:
+            command.append("--cached")
+        diff_output = await self.execute_command(repo_path, command, ctx=ctx)
+
+        diffs: dict[str, str] = {}
+        for section in _DIFF_SECTION_RE.split(_UNMERGED_NOTE_RE.sub("", diff_output)):
+            if not section:
+                continue
+            section = section.rstrip("\n")
+            path = _diff_section_path(section)
+            # A type change (e.g. file to symlink) is a delete and an add
+            # section for the same path
+            diffs[path] = f"{diffs[path]}\n{section}" if path in diffs else section
+
+        if ctx:
+            await ctx.debug(f"Split diff into {len(diffs)} files")
+
+        return diffs
+
     async def get_diff_stats(
         self,
         repo_path: Path,
@@ -383,7 +521,7 @@ class GitClient:
                 await ctx.debug(f"Current branch: {current_branch}")
 
             # Get unpushed commits
-            log_format = '--pretty=format:{"sha":"%H","message":"%s","author":"%an","email":"%ae","date":"%ai"}'
+            log_format = "--pretty=format:%H%x1f%s%x1f%an%x1f%ae%x1f%ai%x1e"
             upstream = f"{remote}/{current_branch}"
 
             try:
@@ -404,18 +542,21 @@ class GitClient:
                     repo_path, ["log", log_format, "--max-count=10"], ctx=ctx
                 )
 
+            # Fields are separated by US (0x1f) and commits by RS (0x1e), so
+            # quotes or newlines in subjects and names cannot break parsing
             commits = []
-            for line in output.split("\n"):
-                if line.strip():
-                    try:
-                        commit_data = json.loads(line)
-                        commits.append(commit_data)
-                    except json.JSONDecodeError:
-                        if ctx:
-                            await ctx.warning(
-                                f"Failed to parse commit JSON: {line[:50]}..."
-                            )
-                        continue
+            for record in output.split("\x1e"):
+                record = record.lstrip("\n")
+                if not record:
+                    continue
+                fields = record.split("\x1f")
+                if len(fields) != len(_COMMIT_FIELDS):
+                    if ctx:
+                        await ctx.warning(
+                            f"Failed to parse commit record: {record[:50]}..."
+                        )
+                    continue
+                commits.append(dict(zip(_COMMIT_FIELDS, fields)))
 
             if ctx:
                 await ctx.debug(f"Found {len(commits)} unpushed commits")
@@ -471,25 +612,35 @@ class GitClient:
             await ctx.debug("Getting branch information")
 
         try:
-            # Get current branch
-            current_branch = await self.execute_command(
-                repo_path, ["branch", "--show-current"], ctx=ctx
-            )
+            # One rev-parse resolves HEAD, the branch name and its upstream. It
+            # fails as a whole when there is no upstream (or HEAD is detached or
+            # unborn), in which case look up what can be resolved separately.
+            upstream: Optional[str] = None
+            head_result: str | GitCommandError
+            try:
+                head_result, current_branch, upstream = (
+                    await self.execute_command(
+                        repo_path,
+                        ["rev-parse", "HEAD", "--abbrev-ref", "HEAD", "@{upstream}"],
+                        ctx=ctx,
+                    )
+                ).split("\n")
+            except (GitCommandError, ValueError):
+                if ctx:
+                    await ctx.debug("No upstream branch configured")
+                branch_result, head_result = await self._gather_commands(
+                    repo_path,
+                    [["branch", "--show-current"], ["rev-parse", "HEAD"]],
+                    ctx=ctx,
+                )
+                if isinstance(branch_result, GitCommandError):
+                    raise branch_result from None
+                current_branch = branch_result
 
             if ctx:
                 await ctx.debug(f"Current branch: {current_branch}")
-
-            # Get upstream info
-            upstream = None
-            try:
-                upstream = await self.execute_command(
-                    repo_path, ["rev-parse", "--abbrev-ref", "@{upstream}"], ctx=ctx
-                )
-                if ctx:
+                if upstream:
                     await ctx.debug(f"Upstream branch: {upstream}")
-            except GitCommandError:
-                if ctx:
-                    await ctx.debug("No upstream branch configured")
 
             # Get ahead/behind counts
             ahead, behind = 0, 0
@@ -512,16 +663,14 @@ class GitClient:
                         await ctx.warning(f"Failed to get ahead/behind counts: {e}")
 
             # Get HEAD commit SHA
-            try:
-                head_commit = await self.execute_command(
-                    repo_path, ["rev-parse", "HEAD"], ctx=ctx
-                )
-                if ctx:
-                    await ctx.debug(f"HEAD commit: {head_commit[:8]}...")
-            except GitCommandError:
+            if isinstance(head_result, GitCommandError):
                 head_commit = "unknown"
                 if ctx:
                     await ctx.warning("Failed to get HEAD commit SHA")
+            else:
+                head_commit = head_result
+                if ctx:
+                    await ctx.debug(f"HEAD commit: {head_commit[:8]}...")
 
             return {
                 "current_branch": current_branch,
@@ -550,22 +699,27 @@ class GitClient:
             await ctx.debug("Getting repository information")
 
         try:
+            # The probes below are independent - run them together
+            bare_result, remote_result, status_result = await self._gather_commands(
+                repo_path,
+                [
+                    ["rev-parse", "--is-bare-repository"],
+                    ["remote", "-v"],
+                    ["status", "--porcelain"],
+                ],
+                ctx=ctx,
+            )
+
             # Check if it's a bare repository
-            try:
-                await self.execute_command(
-                    repo_path, ["rev-parse", "--is-bare-repository"], ctx=ctx
-                )
-                is_bare = True
-            except GitCommandError:
-                is_bare = False
+            is_bare = not isinstance(bare_result, GitCommandError)
 
             # Get remote URLs
-            remotes: dict[str, dict[str, str]] = {}
-            try:
-                remote_output = await self.execute_command(
-                    repo_path, ["remote", "-v"], ctx=ctx
-                )
-                for line in remote_output.split("\n"):
+            remotes: defaultdict[str, dict[str, str]] = defaultdict(dict)
+            if isinstance(remote_result, GitCommandError):
+                if ctx:
+                    await ctx.debug("No remotes configured")
+            else:
+                for line in remote_result.split("\n"):
                     if line.strip():
                         parts = line.split()
                         if len(parts) >= 3:
@@ -573,22 +727,13 @@ class GitClient:
                             remote_url = parts[1]
                             remote_type = parts[2].strip("()")
 
-                            if remote_name not in remotes:
-                                remotes[remote_name] = {}
                             remotes[remote_name][remote_type] = remote_url
 
-            except GitCommandError:
-                if ctx:
-                    await ctx.debug("No remotes configured")
-
             # Check if repository is dirty (has uncommitted changes)
-            try:
-                status_output = await self.execute_command(
-                    repo_path, ["status", "--porcelain"], ctx=ctx
-                )
-                is_dirty = bool(status_output.strip())
-            except GitCommandError:
+            if isinstance(status_result, GitCommandError):
                 is_dirty = False
+            else:
+                is_dirty = bool(status_result.strip())
 
             if ctx:
                 await ctx.debug(
@@ -598,7 +743,7 @@ class GitClient:
             return {
                 "is_bare": is_bare,
                 "is_dirty": is_dirty,
-                "remotes": remotes,
+                "remotes": dict(remotes),
                 "root_path": str(repo_path),
             }
 
@@ -611,3 +756,44 @@ class GitClient:
                 "remotes": {},
                 "root_path": str(repo_path),
             }
+
+
+def _diff_section_path(section: str) -> str:
+    """Get the (post-image) path a ``git diff`` file section is about."""
+    header, _, rest = section.partition("\n")
+    if not header.startswith("diff --git "):
+        # "diff --cc <path>" / "diff --combined <path>" for unmerged paths
+        return _unquote_path(header.split(" ", 2)[2])
+
+    for line in rest.split("\n"):
+        if line.startswith(("--- ", "+++ ", "@@", "Binary files ")):
+            break
+        if line.startswith(_DIFF_TARGET_PREFIXES):
+            return _unquote_path(line.split(" ", 2)[2])
+
+    # Without a rename or copy both header paths are the same, either both
+    # C-quoted ("a/x" "b/x") or both bare (a/x b/x, where x may contain " b/")
+    names = header[len("diff --git ") :]
+    if names.endswith('"'):
+        return _unquote_path(names[names.rindex(' "') + 1 :])[len("b/") :]
+    half = (len(names) - 1) // 2
+    return names[half + 1 + len("b/") :]
+
+
+def _unquote_path(path: str) -> str:
+    """Decode a path as printed by git, which C-quotes unusual names."""
+    if not (len(path) > 1 and path.startswith('"') and path.endswith('"')):
+        return path
+    raw = bytearray()
+    chars = iter(path[1:-1])
+    for char in chars:
+        if char != "\\":
+            raw += char.encode()
+            continue
+        escaped = next(chars, "")
+        if escaped in _C_ESCAPES:
+            raw += _C_ESCAPES[escaped]
+        else:
+            # Octal byte escape, e.g. \303\251 for a UTF-8 "é"
+            raw.append(int(escaped + next(chars, "") + next(chars, ""), 8))
+    return raw.decode("utf-8", errors="replace")
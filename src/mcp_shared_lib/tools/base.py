@@ -1,5 +1,6 @@
 """Base tool functionality for FastMCP tools."""
 
+import logging
 from abc import ABC, abstractmethod
 from typing import Any
 
@@ -20,13 +21,17 @@ class BaseMCPTool(ABC):
 
     def _log_execution_start(self, operation: str, **params: Any) -> None:
         """Log the start of an operation."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         param_str = ", ".join(f"{k}={v}" for k, v in params.items())
-        self.logger.info(f"Starting {operation} with parameters: {param_str}")
+        self.logger.info("Starting %s with parameters: %s", operation, param_str)
 
     def _log_execution_end(
         self, operation: str, success: bool = True, **results: Any
     ) -> None:
         """Log the end of an operation."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         status = "completed" if success else "failed"
         result_str = ", ".join(f"{k}={v}" for k, v in results.items())
-        self.logger.info(f"Operation {operation} {status}: {result_str}")
+        self.logger.info("Operation %s %s: %s", operation, status, result_str)
@@ -4,13 +4,34 @@ This module provides a unified transport abstraction for MCP servers,
 supporting multiple transport protocols including stdio, HTTP, WebSocket, and SSE.
 """
 
+from typing import TYPE_CHECKING, Any
+
 from .base import BaseTransport
 from .config import TransportConfig
 from .factory import get_transport
-from .http import HttpTransport
-from .sse import SSETransport
 from .stdio import StdioTransport
-from .websocket import WebSocketTransport
+
+if TYPE_CHECKING:
+    from .http import HttpTransport
+    from .sse import SSETransport
+    from .websocket import WebSocketTransport
+
+# Network transports are only imported when first accessed
+_LAZY_TRANSPORTS = {
+    "HttpTransport": ".http",
+    "SSETransport": ".sse",
+    "WebSocketTransport": ".websocket",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import network transport classes on first access."""
+    if name in _LAZY_TRANSPORTS:
+        from importlib import import_module
+
+        return getattr(import_module(_LAZY_TRANSPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "BaseTransport",
@@ -51,8 +51,8 @@ class BaseTransport(ABC):
         self.logger.setLevel(log_level)
 
         if log_config.transport_details:
-            self.logger.info(f"Transport configured: {self.config.type}")
-            self.logger.debug(f"Transport config: {self.config}")
+            self.logger.info("Transport configured: %s", self.config.type)
+            self.logger.debug("Transport config: %s", self.config)
 
     @abstractmethod
     def run(self, server: FastMCP) -> None:
@@ -110,7 +110,7 @@ class BaseTransport(ABC):
             details: Request details to log
         """
         if self.config.logging.request_logging:
-            self.logger.info(f"{method} request: {details}")
+            self.logger.info("%s request: %s", method, details)
 
     def _log_error(self, error: Exception, context: str = "") -> None:
         """Log error details if error logging is enabled.
@@ -181,7 +181,7 @@ class HttpBasedTransport(BaseTransport):
             and hasattr(transport_config, "cors_origins")
             and isinstance(transport_config, (HTTPConfig, SSEConfig))
         ):
-            self.logger.debug(f"CORS origins: {transport_config.cors_origins}")
+            self.logger.debug("CORS origins: %s", transport_config.cors_origins)
             # Note: Actual CORS implementation would depend on FastMCP's capabilities
             # This is a placeholder for future CORS implementation
 
@@ -1,18 +1,27 @@
 """Transport configuration models and utilities."""
 
+import functools
 import os
 from typing import Optional
 
 import yaml  # type: ignore[import-untyped]
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Prefer the LibYAML-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 
 
 class HTTPConfig(BaseModel):
     """Define Configuration for connection over HTTP."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     host: str = Field(default="0.0.0.0")
     port: int = Field(default=8000)
-    cors_origins: Optional[list[str]] = Field(default_factory=lambda: ["*"])
+    cors_origins: Optional[tuple[str, ...]] = Field(default=("*",))
     enable_health_check: bool = Field(default=True)
     health_check_path: str = Field(default="/health")
 
@@ -20,6 +29,8 @@ class HTTPConfig(BaseModel):
 class WebSocketConfig(BaseModel):
     """Define Configuration for connection over websocket."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     host: str = Field(default="0.0.0.0")
     port: int = Field(default=8001)
     heartbeat_interval: int = Field(default=30)
@@ -28,9 +39,11 @@ class WebSocketConfig(BaseModel):
 class SSEConfig(BaseModel):
     """Define Configuration for connection over SSE."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     host: str = Field(default="0.0.0.0")
     port: int = Field(default=8003)
-    cors_origins: Optional[list[str]] = Field(default_factory=lambda: ["*"])
+    cors_origins: Optional[tuple[str, ...]] = Field(default=("*",))
     enable_health_check: bool = Field(default=True)
     health_check_path: str = Field(default="/healthz")
 
@@ -38,6 +51,8 @@ class SSEConfig(BaseModel):
 class LoggingConfig(BaseModel):
     """Logging config."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     level: str = Field(default="INFO")
     transport_details: bool = Field(default=True)
     request_logging: bool = Field(default=True)
@@ -47,6 +62,8 @@ class LoggingConfig(BaseModel):
 class TransportConfig(BaseModel):
     """Base transport config."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     type: str = Field(default="stdio")  # stdio, http, websocket, sse
     http: Optional[HTTPConfig] = None
     websocket: Optional[WebSocketConfig] = None
@@ -70,63 +87,82 @@ class TransportConfig(BaseModel):
         Reads transport configuration settings from environment variables,
         including HTTP, WebSocket, SSE, and logging configurations.
 
+        The values are converted to their field types here, so the models are
+        built with ``model_construct`` and skip Pydantic validation.
+
         Returns:
             TransportConfig: Configured transport settings based on environment.
         """
-        ttype = os.environ.get("MCP_TRANSPORT", "stdio")
+        env = os.environ
+        ttype = env.get("MCP_TRANSPORT", "stdio")
         http = None
         websocket = None
         sse = None
 
         if ttype == "http":
-            http = HTTPConfig(
-                host=os.environ.get("MCP_HTTP_HOST", "0.0.0.0"),
-                port=int(os.environ.get("MCP_HTTP_PORT", 8000)),
-                cors_origins=os.environ.get("MCP_HTTP_CORS_ORIGINS", "*").split(","),
+            http = HTTPConfig.model_construct(
+                host=env.get("MCP_HTTP_HOST", "0.0.0.0"),
+                port=int(env.get("MCP_HTTP_PORT", 8000)),
+                cors_origins=_split_csv(env.get("MCP_HTTP_CORS_ORIGINS", "*")),
             )
-        if ttype == "websocket":
-            websocket = WebSocketConfig(
-                host=os.environ.get("MCP_WS_HOST", "0.0.0.0"),
-                port=int(os.environ.get("MCP_WS_PORT", 8001)),
-                heartbeat_interval=int(os.environ.get("MCP_WS_HEARTBEAT_INTERVAL", 30)),
+        elif ttype == "websocket":
+            websocket = WebSocketConfig.model_construct(
+                host=env.get("MCP_WS_HOST", "0.0.0.0"),
+                port=int(env.get("MCP_WS_PORT", 8001)),
+                heartbeat_interval=int(env.get("MCP_WS_HEARTBEAT_INTERVAL", 30)),
             )
-        if ttype == "sse":
-            sse = SSEConfig(
-                host=os.environ.get("MCP_SSE_HOST", "0.0.0.0"),
-                port=int(os.environ.get("MCP_SSE_PORT", 8003)),
-                cors_origins=os.environ.get("MCP_SSE_CORS_ORIGINS", "*").split(","),
+        elif ttype == "sse":
+            sse = SSEConfig.model_construct(
+                host=env.get("MCP_SSE_HOST", "0.0.0.0"),
+                port=int(env.get("MCP_SSE_PORT", 8003)),
+                cors_origins=_split_csv(env.get("MCP_SSE_CORS_ORIGINS", "*")),
             )
-        logging = LoggingConfig(
-            level=os.environ.get("MCP_LOG_LEVEL", "INFO"),
-            transport_details=os.environ.get(
-                "MCP_LOG_TRANSPORT_DETAILS", "true"
-            ).lower()
+        logging = LoggingConfig.model_construct(
+            level=env.get("MCP_LOG_LEVEL", "INFO"),
+            transport_details=env.get("MCP_LOG_TRANSPORT_DETAILS", "true").lower()
             == "true",
         )
-        return cls(type=ttype, http=http, websocket=websocket, sse=sse, logging=logging)
+        return cls.model_construct(
+            type=ttype, http=http, websocket=websocket, sse=sse, logging=logging
+        )
 
     @classmethod
     def from_file(cls, path: str) -> "TransportConfig":
-        """Create a TransportConfig instance from a YAML file."""
-        with open(path) as f:
-            data = yaml.safe_load(f)
-        ttype = data.get("transport", {}).get("type", "stdio")
-        http = None
-        websocket = None
-        sse = None
-        logging = None
-        if "http" in data.get("transport", {}):
-            http = HTTPConfig(**data["transport"]["http"])
-        if "websocket" in data.get("transport", {}):
-            websocket = WebSocketConfig(**data["transport"]["websocket"])
-        if "sse" in data.get("transport", {}):
-            sse = SSEConfig(**data["transport"]["sse"])
-        if "logging" in data.get("transport", {}):
-            logging = LoggingConfig(**data["transport"]["logging"])
-        return cls(
-            type=ttype,
-            http=http,
-            websocket=websocket,
-            sse=sse,
-            logging=logging or LoggingConfig(),
+        """Create a TransportConfig instance from a YAML file.
+
+        Parsed configs are cached per file version (path, mtime and size), so
+        reloading an unchanged file skips YAML parsing and model validation.
+        """
+        stat = os.stat(path)
+        config = _load_config_file(
+            cls, os.path.abspath(path), stat.st_mtime_ns, stat.st_size
         )
+        # Configs are frozen and hold only tuples, so the cached instance is
+        # safe to share between callers
+        return config
+
+    @classmethod
+    def _parse_file(cls, path: str) -> "TransportConfig":
+        """Parse and validate a transport config YAML file."""
+        with open(path) as f:
+            data = yaml.load(f, Loader=_YamlLoader)  # nosec B506 - safe loader
+        tcfg = (data or {}).get("transport") or {}
+        sections = {
+            name: tcfg[name]
+            for name in ("http", "websocket", "sse", "logging")
+            if name in tcfg
+        }
+        return cls.model_validate({"type": tcfg.get("type", "stdio"), **sections})
+
+
+def _split_csv(value: str) -> tuple[str, ...]:
+    """Split a comma-separated setting, dropping blank entries."""
+    return tuple(item for item in (part.strip() for part in value.split(",")) if item)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_config_file(
+    cls: type[TransportConfig], path: str, _mtime_ns: int, _size: int
+) -> TransportConfig:
+    """Load a config file, cached per (class, path, mtime, size)."""
+    return cls._parse_file(path)
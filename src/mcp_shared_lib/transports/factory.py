@@ -1,11 +1,18 @@
 """Transport factory module for creating transport instances based on configuration."""
 
+from importlib import import_module
+
 from .base import BaseTransport
 from .config import TransportConfig
-from .http import HttpTransport
-from .sse import SSETransport
-from .stdio import StdioTransport
-from .websocket import WebSocketTransport
+
+# Transport type -> (module, class). Modules are imported on first use, so a
+# stdio-only server never loads the HTTP, WebSocket or SSE backends.
+_TRANSPORTS: dict[str, tuple[str, str]] = {
+    "stdio": (".stdio", "StdioTransport"),
+    "http": (".http", "HttpTransport"),
+    "websocket": (".websocket", "WebSocketTransport"),
+    "sse": (".sse", "SSETransport"),
+}
 
 
 def get_transport(config: TransportConfig) -> BaseTransport:
@@ -20,14 +27,16 @@ def get_transport(config: TransportConfig) -> BaseTransport:
     Raises:
         ValueError: If the transport type is unknown.
     """
-    ttype = config.type.lower()
-    if ttype == "stdio":
-        return StdioTransport(config)
-    elif ttype == "http":
-        return HttpTransport(config)
-    elif ttype == "websocket":
-        return WebSocketTransport(config)
-    elif ttype == "sse":
-        return SSETransport(config)
-    else:
-        raise ValueError(f"Unknown transport type: {ttype}")
+    ttype = config.type
+    entry = _TRANSPORTS.get(ttype)
+    if entry is None:
+        # Only normalise case when the type is not already a registered key.
+        ttype = ttype.lower()
+        entry = _TRANSPORTS.get(ttype)
+        if entry is None:
+            raise ValueError(f"Unknown transport type: {ttype}")
+    module_name, class_name = entry
+    transport_cls: type[BaseTransport] = getattr(
+        import_module(module_name, __package__), class_name
+    )
+    return transport_cls(config)
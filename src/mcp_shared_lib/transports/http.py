@@ -49,7 +49,7 @@ class HttpTransport(HttpBasedTransport):
                 f"Starting {self.server_name} with HTTP transport on "
                 f"{self._http_config.host}:{self._http_config.port}"
             )
-            self.logger.debug(f"HTTP config: {self._http_config}")
+            self.logger.debug("HTTP config: %s", self._http_config)
 
             # Run the FastMCP server with streamable HTTP transport
             server.run(
@@ -1,13 +1,17 @@
 """Stdio transport implementation."""
 
 import sys
-from typing import Any
+import time
+from typing import Any, Optional
 
 from fastmcp import FastMCP
 
 from .base import BaseTransport
 from .config import TransportConfig
 
+# How long a computed health snapshot is reused, in seconds
+HEALTH_CACHE_TTL = 1.0
+
 
 class StdioTransport(BaseTransport):
     """Stdio transport for MCP servers.
@@ -26,6 +30,9 @@ class StdioTransport(BaseTransport):
         super().__init__(config, server_name)
         # Stdio doesn't have specific config in the current structure
         self._stdio_config = None
+        # (monotonic timestamp, status) of the last health check; replaced as
+        # a whole so readers never see a half-updated snapshot
+        self._health_snapshot: Optional[tuple[float, dict[str, Any]]] = None
 
     def run(self, server: FastMCP) -> None:
         """Run the stdio transport server.
@@ -39,6 +46,7 @@ class StdioTransport(BaseTransport):
         try:
             self.server = server
             self._is_running = True
+            self._health_snapshot = None
             self.logger.info(f"Starting {self.server_name} with stdio transport")
             server.run(transport="stdio")
         except Exception as e:
@@ -46,6 +54,7 @@ class StdioTransport(BaseTransport):
             raise
         finally:
             self._is_running = False
+            self._health_snapshot = None
 
     def stop(self) -> None:
         """Stop the stdio transport.
@@ -71,9 +80,18 @@ class StdioTransport(BaseTransport):
     def get_health_status(self) -> dict[str, Any]:
         """Get health status for stdio transport.
 
+        The result is cached for ``HEALTH_CACHE_TTL`` seconds so frequent
+        health polling does not rebuild the status on every call. The cache
+        is dropped whenever the transport starts or stops.
+
         Returns:
             Dictionary containing health status information
         """
+        now = time.monotonic()
+        snapshot = self._health_snapshot
+        if snapshot is not None and now - snapshot[0] < HEALTH_CACHE_TTL:
+            return _copy_status(snapshot[1])
+
         status = super().get_health_status()
 
         # Add stdio-specific health checks
@@ -93,4 +111,10 @@ class StdioTransport(BaseTransport):
         if not stdio_healthy:
             status["status"] = "unhealthy"
 
-        return status
+        self._health_snapshot = (now, status)
+        return _copy_status(status)
+
+
+def _copy_status(status: dict[str, Any]) -> dict[str, Any]:
+    """Copy a cached health status, including its nested connection info."""
+    return {**status, "connection_info": dict(status["connection_info"])}
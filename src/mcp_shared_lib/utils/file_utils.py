@@ -1,16 +1,10 @@
 """File manipulation utilities."""
 
+import os
 from pathlib import Path
 
-
-def get_file_extension(file_path: str | Path) -> str:
-    """Get file extension from path."""
-    return Path(file_path).suffix.lower()
-
-
-def is_binary_file(file_path: str | Path) -> bool:
-    """Check if file is likely binary based on extension."""
-    binary_extensions = {
+_BINARY_EXTENSIONS = frozenset(
+    {
         ".exe",
         ".dll",
         ".so",
@@ -52,4 +46,16 @@ def is_binary_file(file_path: str | Path) -> bool:
         ".db",
         ".mdb",
     }
-    return get_file_extension(file_path) in binary_extensions
+)
+
+
+def get_file_extension(file_path: str | Path) -> str:
+    """Get file extension from path."""
+    _, ext = os.path.splitext(file_path)
+    # A bare trailing dot is not an extension (matches Path.suffix)
+    return "" if ext == "." else ext.lower()
+
+
+def is_binary_file(file_path: str | Path) -> bool:
+    """Check if file is likely binary based on extension."""
+    return get_file_extension(file_path) in _BINARY_EXTENSIONS
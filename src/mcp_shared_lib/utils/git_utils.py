@@ -13,6 +13,20 @@ extension extraction, and binary file detection.
 import re
 from pathlib import Path
 
+# Extension helpers live in file_utils; re-exported here for existing imports
+from mcp_shared_lib.utils.file_utils import (  # noqa: F401
+    get_file_extension,
+    is_binary_file,
+)
+
+_SSH_URL_RE = re.compile(r"git@([^:]+):([^/]+)/(.+?)(?:\.git)?$")
+_HTTPS_URL_RE = re.compile(r"https://([^/]+)/([^/]+)/(.+?)(?:\.git)?$")
+_INSERTIONS_RE = re.compile(r"(\d+) insertion")
+_DELETIONS_RE = re.compile(r"(\d+) deletion")
+
+# Characters that are not allowed in filenames on common platforms
+_UNSAFE_FILENAME_CHARS = str.maketrans(dict.fromkeys('<>:"/\\|?*', "_"))
+
 
 def is_git_repository(path: str | Path) -> bool:
     """Check if the given path is a git repository.
@@ -55,8 +69,7 @@ def parse_git_url(url: str) -> dict[str, str]:
         Dictionary with protocol, host, owner, and repo keys.
     """
     # Handle SSH URLs like git@github.com:user/repo.git
-    ssh_pattern = r"git@([^:]+):([^/]+)/(.+?)(?:\.git)?$"
-    ssh_match = re.match(ssh_pattern, url)
+    ssh_match = _SSH_URL_RE.match(url)
 
     if ssh_match:
         return {
@@ -67,8 +80,7 @@ def parse_git_url(url: str) -> dict[str, str]:
         }
 
     # Handle HTTPS URLs like https://github.com/user/repo.git
-    https_pattern = r"https://([^/]+)/([^/]+)/(.+?)(?:\.git)?$"
-    https_match = re.match(https_pattern, url)
+    https_match = _HTTPS_URL_RE.match(url)
 
     if https_match:
         return {
@@ -132,8 +144,8 @@ def safe_filename(filename: str) -> str:
     Returns:
         Safe filename string.
     """
-    # Remove or replace unsafe characters
-    safe = re.sub(r'[<>:"/\\|?*]', "_", filename)
+    # Replace unsafe characters
+    safe = filename.translate(_UNSAFE_FILENAME_CHARS)
     # Remove leading/trailing dots and spaces
     safe = safe.strip(". ")
     # Limit length
@@ -156,12 +168,12 @@ def parse_diff_stats(stats_line: str) -> tuple[int, int]:
     deletions = 0
 
     # Extract insertions
-    insertion_match = re.search(r"(\d+) insertion", stats_line)
+    insertion_match = _INSERTIONS_RE.search(stats_line)
     if insertion_match:
         insertions = int(insertion_match.group(1))
 
     # Extract deletions
-    deletion_match = re.search(r"(\d+) deletion", stats_line)
+    deletion_match = _DELETIONS_RE.search(stats_line)
     if deletion_match:
         deletions = int(deletion_match.group(1))
 
@@ -195,71 +207,3 @@ def normalize_path(path: str | Path) -> str:
         Normalized POSIX-style path string.
     """
     return str(Path(path).as_posix())
-
-
-def get_file_extension(filename: str) -> str:
-    """Get file extension from filename.
-
-    Args:
-        filename: Filename string.
-
-    Returns:
-        Lowercase file extension string.
-    """
-    return Path(filename).suffix.lower()
-
-
-def is_binary_file(file_path: str | Path) -> bool:
-    """Check if a file is likely binary based on extension.
-
-    Args:
-        file_path: File path string or Path object.
-
-    Returns:
-        True if file is binary, False otherwise.
-    """
-    binary_extensions = {
-        ".exe",
-        ".dll",
-        ".so",
-        ".dylib",
-        ".bin",
-        ".obj",
-        ".o",
-        ".a",
-        ".lib",
-        ".jpg",
-        ".jpeg",
-        ".png",
-        ".gif",
-        ".bmp",
-        ".ico",
-        ".svg",
-        ".tiff",
-        ".mp3",
-        ".mp4",
-        ".avi",
-        ".mov",
-        ".wav",
-        ".flac",
-        ".ogg",
-        ".pdf",
-        ".doc",
-        ".docx",
-        ".xls",
-        ".xlsx",
-        ".ppt",
-        ".pptx",
-        ".zip",
-        ".tar",
-        ".gz",
-        ".bz2",
-        ".7z",
-        ".rar",
-        ".sqlite",
-        ".db",
-        ".mdb",
-    }
-
-    extension = get_file_extension(str(file_path))
-    return extension in binary_extensions
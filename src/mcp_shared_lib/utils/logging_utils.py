@@ -11,12 +11,160 @@ subscriptions.
 
 import asyncio
 import logging
-from collections.abc import AsyncGenerator
+import weakref
+from collections import defaultdict
+from collections.abc import Coroutine, Iterable
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import Any, Optional, cast
 
 from mcp_shared_lib.models.base.types import LogLevel
 
+# Number of recent log messages kept for subscribers
+LOG_BUFFER_SIZE = 1024
+
+# Standard logging level for each MCP (RFC 5424) level. NOTICE, ALERT and
+# EMERGENCY have no stdlib counterpart, so they are slotted in around the
+# standard levels to keep the ordering intact.
+_LEVEL_MAP: dict[LogLevel, int] = {
+    LogLevel.DEBUG: logging.DEBUG,
+    LogLevel.INFO: logging.INFO,
+    LogLevel.NOTICE: logging.INFO + 5,
+    LogLevel.WARNING: logging.WARNING,
+    LogLevel.ERROR: logging.ERROR,
+    LogLevel.CRITICAL: logging.CRITICAL,
+    LogLevel.ALERT: logging.CRITICAL + 10,
+    LogLevel.EMERGENCY: logging.CRITICAL + 20,
+}
+
+
+class _LogRing:
+    """Fixed-size broadcast buffer of log messages.
+
+    Each message is stored once and every reader tracks its own position, so
+    publishing costs the same regardless of the number of subscribers.
+    Readers that fall more than the buffer size behind skip ahead to the
+    oldest message still held. Closing the ring drops the buffered messages
+    and ends every reader.
+    """
+
+    def __init__(self, capacity: int = LOG_BUFFER_SIZE) -> None:
+        self._buffer: list[Optional[dict[str, Any]]] = [None] * capacity
+        self._capacity = capacity
+        self._waiters: set[asyncio.Future[None]] = set()
+        self.head = 0
+        self.closed = False
+
+    def publish(self, message: dict[str, Any]) -> None:
+        """Store a message and wake waiting readers."""
+        self._buffer[self.head % self._capacity] = message
+        self.head += 1
+        self._wake()
+
+    def publish_many(self, messages: Iterable[dict[str, Any]]) -> None:
+        """Store several messages and wake waiting readers once."""
+        for message in messages:
+            self._buffer[self.head % self._capacity] = message
+            self.head += 1
+        self._wake()
+
+    def close(self) -> None:
+        """Drop the buffered messages and end every reader."""
+        self.closed = True
+        self._buffer.clear()
+        self._wake()
+
+    def _wake(self) -> None:
+        """Resume every reader waiting for new messages."""
+        waiters, self._waiters = self._waiters, set()
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def read(
+        self, position: int, max_lag: int = LOG_BUFFER_SIZE
+    ) -> tuple[dict[str, Any], int]:
+        """Wait for the message at a position.
+
+        Args:
+            position: Sequence number of the message to read
+            max_lag: Furthest a reader may be behind the newest message;
+                older positions skip ahead to the oldest one within reach
+
+        Returns:
+            The message and the position it was actually read from
+
+        Raises:
+            StopAsyncIteration: If the ring is closed
+        """
+        while position == self.head and not self.closed:
+            # Futures rather than an Event, so readers on different event
+            # loops can share the buffer
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.add(waiter)
+            try:
+                await waiter
+            finally:
+                self._waiters.discard(waiter)
+        if self.closed:
+            raise StopAsyncIteration
+
+        position = max(position, self.head - min(max_lag, self._capacity))
+        message = self._buffer[position % self._capacity]
+        return cast(dict[str, Any], message), position
+
+
+# Stand-in ring for closed subscriptions, so they stop referencing (and keeping
+# alive) the ring they were reading from
+_CLOSED_RING = _LogRing(capacity=1)
+_CLOSED_RING.close()
+
+
+class LogSubscription:
+    """Subscription to log message events.
+
+    Delivers every message notified after the subscription was created, either
+    by iterating with ``async for`` or by awaiting ``recv_one()``. A subscriber
+    that falls more than ``max_lag`` messages behind skips the oldest ones;
+    ``dropped`` counts how many were skipped. Iteration ends when the
+    subscription is closed or the logging service shuts down.
+    """
+
+    __slots__ = ("_ring", "_position", "_max_lag", "dropped")
+
+    def __init__(self, ring: _LogRing, max_lag: int = LOG_BUFFER_SIZE) -> None:
+        """Start reading from the ring's current position."""
+        if max_lag < 1:
+            raise ValueError("max_lag must be at least 1")
+        self._ring = ring
+        self._position = ring.head
+        self._max_lag = max_lag
+        self.dropped = 0
+
+    def __aiter__(self) -> "LogSubscription":
+        """Return the subscription itself as its async iterator."""
+        return self
+
+    def __anext__(self) -> Coroutine[Any, Any, dict[str, Any]]:
+        """Hand back recv_one's coroutine directly, without wrapping it."""
+        if self._ring.closed:
+            raise StopAsyncIteration
+        return self.recv_one()
+
+    async def recv_one(self) -> dict[str, Any]:
+        """Wait for and return the next log message event.
+
+        Raises:
+            StopAsyncIteration: If the logging service has shut down
+        """
+        message, position = await self._ring.read(self._position, self._max_lag)
+        self.dropped += position - self._position
+        self._position = position + 1
+        return message
+
+    async def aclose(self) -> None:
+        """Stop the subscription; iteration ends on the next step."""
+        self._ring = _CLOSED_RING
+
 
 class LoggingService:
     """MCP logging service.
@@ -31,23 +179,47 @@ class LoggingService:
     def __init__(self) -> None:
         """Initialize logging service."""
         self._level = LogLevel.INFO
-        self._subscribers: list[asyncio.Queue[dict[str, Any]]] = []
+        self._level_no = _LEVEL_MAP[self._level]
+        # Every message goes to the main ring; subscribers filtering on one
+        # logger name read from that name's ring, created on first subscribe.
+        # Named rings live only as long as a subscription still reads them.
+        self._ring = _LogRing()
+        self._named_rings: weakref.WeakValueDictionary[
+            str, _LogRing
+        ] = weakref.WeakValueDictionary()
         self._loggers: dict[str, logging.Logger] = {}
+        self._initialized_level: Optional[LogLevel] = None
 
     async def initialize(self, level: LogLevel) -> None:
-        """Initialize logging service."""
+        """Initialize logging service.
+
+        Repeated calls with the level the service was already initialized
+        with are no-ops.
+        """
+        if self._initialized_level == level:
+            return
+
         # Configure root logger
         logging.basicConfig(
             level=level.value,
             format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         )
         self._loggers[""] = logging.getLogger()
+        self._initialized_level = level
         logging.info("Logging service initialized")
 
     async def shutdown(self) -> None:
-        """Shutdown logging service."""
-        # Clear subscribers
-        self._subscribers.clear()
+        """Shutdown logging service.
+
+        Ends every outstanding subscription and drops the buffered messages.
+        """
+        # Detach subscribers
+        self._ring.close()
+        for named_ring in list(self._named_rings.values()):
+            named_ring.close()
+        self._ring = _LogRing()
+        self._named_rings.clear()
+        self._initialized_level = None
         logging.info("Logging service shutdown")
 
     def get_logger(self, name: str) -> logging.Logger:
@@ -59,33 +231,43 @@ class LoggingService:
         Returns:
             Logger instance
         """
-        if name not in self._loggers:
+        logger = self._loggers.get(name)
+        if logger is None:
             logger = logging.getLogger(name)
 
             # Set level to match service level
-            log_level = getattr(logging, self._level.upper())
-            logger.setLevel(log_level)
+            logger.setLevel(self._level_no)
 
             self._loggers[name] = logger
 
-        return self._loggers[name]
+        return logger
 
-    async def set_level(self, level: LogLevel) -> None:
+    def set_level(self, level: LogLevel) -> None:
         """Set minimum log level.
 
-        This updates the level for all registered loggers.
+        This updates the level for all registered loggers. Nothing here does
+        I/O, so the method is synchronous; use ``aset_level`` where a
+        coroutine is expected.
 
         Args:
             level: New log level
         """
         self._level = level
+        self._level_no = _LEVEL_MAP[level]
 
         # Update all loggers
-        log_level = getattr(logging, level.upper())
         for logger in self._loggers.values():
-            logger.setLevel(log_level)
+            logger.setLevel(self._level_no)
 
-        await self.notify(f"Log level set to {level}", LogLevel.INFO, "logging")
+        self.notify_nowait(f"Log level set to {level}", LogLevel.INFO, "logging")
+
+    async def aset_level(self, level: LogLevel) -> None:
+        """Set minimum log level from async code.
+
+        Args:
+            level: New log level
+        """
+        self.set_level(level)
 
     async def notify(
         self, data: Any, level: LogLevel, logger_name: Optional[str] = None
@@ -97,9 +279,67 @@ class LoggingService:
             level: Log severity level
             logger_name: Optional logger name
         """
+        self.notify_nowait(data, level, logger_name)
+
+    def notify_nowait(
+        self, data: Any, level: LogLevel, logger_name: Optional[str] = None
+    ) -> None:
+        """Send log notification to subscribers from synchronous code.
+
+        Publishing never waits on subscribers, so this delivers exactly what
+        ``notify`` does without needing a running coroutine.
+
+        Args:
+            data: Log message data
+            level: Log severity level
+            logger_name: Optional logger name
+        """
+        message = self._log_message(data, level, logger_name)
+        if message is not None:
+            self._ring.publish(message)
+            named_ring = self._named_rings.get(logger_name or "")
+            if named_ring is not None:
+                named_ring.publish(message)
+
+    async def notify_many(
+        self, records: Iterable[tuple[Any, LogLevel, Optional[str]]]
+    ) -> None:
+        """Send several log notifications to subscribers at once.
+
+        Subscribers are woken once for the whole batch rather than per message.
+
+        Args:
+            records: (data, level, logger_name) tuples, in delivery order
+        """
+        messages = [
+            message
+            for message in (self._log_message(*record) for record in records)
+            if message is not None
+        ]
+        if not messages:
+            return
+
+        self._ring.publish_many(messages)
+        if self._named_rings:
+            by_name: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
+            for message in messages:
+                by_name[message["data"].get("logger", "")].append(message)
+            for name, named_messages in by_name.items():
+                named_ring = self._named_rings.get(name)
+                if named_ring is not None:
+                    named_ring.publish_many(named_messages)
+
+    def _log_message(
+        self, data: Any, level: LogLevel, logger_name: Optional[str]
+    ) -> Optional[dict[str, Any]]:
+        """Log through standard logging and build the notification message.
+
+        Returns:
+            The notification message, or None if the level is filtered out
+        """
         # Skip if below current level
         if not self._should_log(level):
-            return
+            return None
 
         # Format notification message
         log_data: dict[str, Any] = {
@@ -114,34 +354,37 @@ class LoggingService:
         if logger_name:
             log_data["logger"] = logger_name
 
-        # Log through standard logging
-        logger = self.get_logger(logger_name or "")
-        log_func = getattr(logger, level.lower(), logger.info)
-        log_func(data)
+        # Log through standard logging at the mapped level, so NOTICE, ALERT
+        # and EMERGENCY aren't emitted as INFO and filtered out
+        self.get_logger(logger_name or "").log(_LEVEL_MAP[level], data)
 
-        # Notify subscribers
-        for queue in self._subscribers:
-            try:
-                await queue.put(message)
-            except Exception as e:
-                logger.error(f"Failed to notify subscriber: {e}")
+        return message
 
-    async def subscribe(self) -> AsyncGenerator[dict[str, Any], None]:
+    def subscribe(
+        self,
+        logger_name: Optional[str] = None,
+        max_lag: int = LOG_BUFFER_SIZE,
+    ) -> "LogSubscription":
         """Subscribe to log messages.
 
-        Returns a generator yielding log message events.
+        Returns an async iterator yielding log message events. Every message
+        notified after this call returns is delivered.
+
+        Args:
+            logger_name: Only deliver messages from this logger; all messages
+                are delivered when omitted
+            max_lag: Most undelivered messages to keep for this subscriber
+                (capped at LOG_BUFFER_SIZE); older ones are dropped
 
-        Yields:
-            Log message events
+        Returns:
+            Subscription yielding log message events
         """
-        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
-        self._subscribers.append(queue)
-        try:
-            while True:
-                message = await queue.get()
-                yield message
-        finally:
-            self._subscribers.remove(queue)
+        if logger_name is None:
+            return LogSubscription(self._ring, max_lag)
+        ring = self._named_rings.get(logger_name)
+        if ring is None:
+            ring = self._named_rings[logger_name] = _LogRing()
+        return LogSubscription(ring, max_lag)
 
     def _should_log(self, level: LogLevel) -> bool:
         """Check if level meets minimum threshold.
@@ -152,18 +395,7 @@ class LoggingService:
         Returns:
             True if should log
         """
-        level_values = {
-            LogLevel.DEBUG: 0,
-            LogLevel.INFO: 1,
-            LogLevel.NOTICE: 2,
-            LogLevel.WARNING: 3,
-            LogLevel.ERROR: 4,
-            LogLevel.CRITICAL: 5,
-            LogLevel.ALERT: 6,
-            LogLevel.EMERGENCY: 7,
-        }
-
-        return level_values[level] >= level_values[self._level]
+        return _LEVEL_MAP[level] >= self._level_no
 
 
 # Module-level singleton for convenience
@@ -4,11 +4,14 @@ This module provides common fixtures and utilities that can be used across
 all MCP projects (shared_lib, local_repo_analyzer, pr_recommender).
 """
 
+import asyncio
+import importlib.util
+import itertools
 import json
 import os
 import shutil
+import sys
 import tempfile
-import uuid
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Optional, Union
@@ -16,12 +19,39 @@ from unittest.mock import Mock
 
 import pytest
 
-try:
-    from git import Repo
+# GitPython is imported inside the git fixtures that use it, so test runs that
+# never touch a repository don't pay for loading it
+HAS_GIT = importlib.util.find_spec("git") is not None
 
-    HAS_GIT = True
+# Run async tests on uvloop where it is installed; it isn't available on
+# every platform, so fall back to the default asyncio loop otherwise
+try:
+    import uvloop
 except ImportError:
-    HAS_GIT = False
+    pass
+else:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """Share one event loop across the test session.
+
+    Overrides pytest-asyncio's per-test loop so async tests and fixtures
+    don't each pay for creating and closing a loop. The loop comes from the
+    current policy, so it is a uvloop loop when uvloop is installed.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def svc():
+    """Shared logging service, the same instance the library notifies through."""
+    from mcp_shared_lib.utils import logging_service
+
+    return logging_service
 
 
 @pytest.fixture(scope="session")
@@ -30,23 +60,45 @@ def test_data_dir():
     return Path(__file__).parent / "fixtures"
 
 
+def _temp_root() -> Optional[str]:
+    """Directory to create test files under, preferring RAM-backed storage.
+
+    ``MCP_TEST_TMPFS`` overrides the location; otherwise ``/dev/shm`` is used
+    on Linux when writable, falling back to the system default.
+    """
+    override = os.environ.get("MCP_TEST_TMPFS")
+    if override:
+        return override
+    if sys.platform == "linux" and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+    return None
+
+
 @pytest.fixture(scope="session")
 def shared_temp_dir():
     """Temporary directory for test session."""
-    temp_dir = Path(tempfile.mkdtemp(prefix="mcp_tests_"))
+    temp_dir = Path(tempfile.mkdtemp(prefix="mcp_tests_", dir=_temp_root()))
     yield temp_dir
     shutil.rmtree(temp_dir, ignore_errors=True)
 
 
+# Per-test directory names only need to be unique within the session
+_test_dir_counter = itertools.count()
+
+
 @pytest.fixture
 def temp_dir(shared_temp_dir):
     """Individual temporary directory for each test."""
-    test_dir = shared_temp_dir / f"test_{uuid.uuid4().hex[:8]}"
+    test_dir = shared_temp_dir / f"test_{next(_test_dir_counter):08x}"
     test_dir.mkdir(parents=True, exist_ok=True)
     yield test_dir
     # Cleanup handled by shared_temp_dir
 
 
+# Fixed reference time so sample data is deterministic across runs
+_BASE_TIME = datetime(2024, 1, 1, 12, 0, 0)
+
+
 @pytest.fixture
 def mock_git_repo():
     """Mock git repository data with common structure."""
@@ -60,7 +112,7 @@ def mock_git_repo():
                 "message": "feat: add new feature for user authentication",
                 "author": "John Doe",
                 "email": "john@example.com",
-                "timestamp": datetime.now() - timedelta(hours=2),
+                "timestamp": _BASE_TIME - timedelta(hours=2),
                 "files_changed": ["src/auth.py", "tests/test_auth.py"],
             },
             {
@@ -68,7 +120,7 @@ def mock_git_repo():
                 "message": "fix: resolve memory leak in data processing",
                 "author": "Jane Smith",
                 "email": "jane@example.com",
-                "timestamp": datetime.now() - timedelta(hours=6),
+                "timestamp": _BASE_TIME - timedelta(hours=6),
                 "files_changed": ["src/processor.py"],
             },
             {
@@ -76,7 +128,7 @@ def mock_git_repo():
                 "message": "docs: update installation instructions",
                 "author": "Bob Wilson",
                 "email": "bob@example.com",
-                "timestamp": datetime.now() - timedelta(days=1),
+                "timestamp": _BASE_TIME - timedelta(days=1),
                 "files_changed": ["README.md", "docs/install.md"],
             },
         ],
@@ -257,7 +309,7 @@ def mock_mcp_server():
 def sample_analysis_result():
     """Sample analysis result for testing."""
     return {
-        "timestamp": datetime.now(),
+        "timestamp": _BASE_TIME,
         "status": "success",
         "summary": "Repository analysis completed successfully",
         "details": {
@@ -370,6 +422,15 @@ def create_test_files():
     return _create_files
 
 
+_SAMPLE_SETTINGS_JSON = json.dumps(
+    {
+        "database": {"host": "localhost", "port": 5432},
+        "api": {"version": "v1", "timeout": 30},
+    },
+    indent=2,
+)
+
+
 @pytest.fixture
 def sample_project_structure():
     """Sample project structure for testing."""
@@ -399,13 +460,7 @@ def sample_project_structure():
             "api.md": "# API Documentation\n\n## Endpoints\n",
         },
         "config": {
-            "settings.json": json.dumps(
-                {
-                    "database": {"host": "localhost", "port": 5432},
-                    "api": {"version": "v1", "timeout": 30},
-                },
-                indent=2,
-            ),
+            "settings.json": _SAMPLE_SETTINGS_JSON,
             "development.env": "DEBUG=true\nLOG_LEVEL=debug\n",
         },
         ".gitignore": "*.pyc\n__pycache__/\n.env\n",
@@ -473,12 +528,24 @@ def environment_variables():
 # Conditional fixtures for git operations (only if git is available)
 if HAS_GIT:
 
-    @pytest.fixture
-    def temp_git_repo(temp_dir, environment_variables):
-        """Create a temporary git repository for testing."""
-        repo_path = temp_dir / "test_repo"
+    def _link_git_object(src: str, dst: str) -> None:
+        """Hardlink immutable git objects, copy everything else."""
+        if f"{os.sep}.git{os.sep}objects{os.sep}" in src:
+            try:
+                os.link(src, dst)
+                return
+            except OSError:
+                pass
+        shutil.copy2(src, dst)
+
+    @pytest.fixture(scope="session")
+    def session_git_repo(shared_temp_dir):
+        """Template git repository, built once per test session."""
+        repo_path = shared_temp_dir / "template_repo"
         repo_path.mkdir()
 
+        from git import Repo
+
         # Initialize git repo
         repo = Repo.init(repo_path)
 
@@ -486,6 +553,8 @@ if HAS_GIT:
         with repo.config_writer() as git_config:
             git_config.set_value("user", "name", "Test User")
             git_config.set_value("user", "email", "test@example.com")
+            # Test repositories are throwaway, so skip fsync on every write
+            git_config.set_value("core", "fsync", "none")
 
         # Create initial files
         readme = repo_path / "README.md"
@@ -500,11 +569,25 @@ if HAS_GIT:
         repo.index.add([str(readme), str(main_file)])
         repo.index.commit("Initial commit")
 
+        return repo_path
+
+    @pytest.fixture
+    def temp_git_repo(session_git_repo, temp_dir, environment_variables):
+        """Create a temporary git repository for testing.
+
+        Each test gets its own copy of the session template repository. Object
+        files are never modified by git, so they are hardlinked rather than
+        copied; the working tree, index and refs are real copies.
+        """
+        repo_path = temp_dir / "test_repo"
+        shutil.copytree(session_git_repo, repo_path, copy_function=_link_git_object)
         yield repo_path
 
     @pytest.fixture
     def repo_with_changes(temp_git_repo):
         """Git repository with various types of changes."""
+        from git import Repo
+
         repo = Repo(temp_git_repo)
 
         # Modify existing file
@@ -598,6 +681,8 @@ def mock_tool_result():
 
 # Export fixtures for use in other test modules
 __all__ = [
+    "event_loop",
+    "svc",
     "test_data_dir",
     "shared_temp_dir",
     "temp_dir",
@@ -612,6 +697,7 @@ __all__ = [
     "json_config_file",
     "mock_git_operations",
     "environment_variables",
+    "session_git_repo",
     "temp_git_repo",
     "repo_with_changes",
     "file_assertions",
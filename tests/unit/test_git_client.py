@@ -0,0 +1,276 @@
+"""Tests for the async git client."""
+
+import asyncio
+import subprocess
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from mcp_shared_lib.config.git_analyzer import GitAnalyzerSettings
+from mcp_shared_lib.services.git.git_client import GitClient, GitCommandError
+
+
+@pytest.fixture
+def git_client():
+    """Git client with default settings."""
+    return GitClient(GitAnalyzerSettings())
+
+
+@pytest.mark.unit
+@pytest.mark.git
+class TestGitClientExecuteCommand:
+    """Tests for GitClient.execute_command."""
+
+    async def test_cancellation_after_process_exit_stays_cancellation(
+        self, git_client, temp_git_repo, monkeypatch
+    ):
+        """Test that cancelling a finished process still raises CancelledError."""
+        process = Mock()
+        process.communicate = AsyncMock(side_effect=asyncio.CancelledError)
+        process.kill.side_effect = ProcessLookupError
+        process.wait = AsyncMock(return_value=0)
+        monkeypatch.setattr(
+            asyncio, "create_subprocess_exec", AsyncMock(return_value=process)
+        )
+
+        with pytest.raises(asyncio.CancelledError):
+            await git_client.execute_command(temp_git_repo, ["status"])
+
+        process.wait.assert_awaited_once()
+
+
+@pytest.mark.unit
+@pytest.mark.git
+class TestGitClientDiffs:
+    """Tests for GitClient diff helpers."""
+
+    async def test_get_file_diffs_maps_each_file(self, git_client, temp_git_repo):
+        """Test that every requested file gets its own diff."""
+        (temp_git_repo / "README.md").write_text("# Changed\n")
+        (temp_git_repo / "src" / "main.py").write_text("print('changed')\n")
+
+        diffs = await git_client.get_file_diffs(
+            temp_git_repo, ["README.md", "src/main.py"]
+        )
+
+        assert list(diffs) == ["README.md", "src/main.py"]
+        assert "+# Changed" in diffs["README.md"]
+        assert "+print('changed')" in diffs["src/main.py"]
+        assert "README.md" not in diffs["src/main.py"]
+
+    async def test_get_file_diffs_cancels_remaining_on_error(
+        self, git_client, temp_git_repo, monkeypatch
+    ):
+        """Test that one failing diff cancels the others instead of orphaning them."""
+        cancelled = []
+
+        async def fake_get_diff(repo_path, staged=False, file_path=None, ctx=None):
+            if file_path == "bad.py":
+                raise GitCommandError(["git", "diff"], 128, "boom")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(file_path)
+                raise
+            return ""
+
+        monkeypatch.setattr(git_client, "get_diff", fake_get_diff)
+        paths = [f"file{i}.py" for i in range(3)] + ["bad.py"]
+
+        with pytest.raises(GitCommandError):
+            await git_client.get_file_diffs(temp_git_repo, paths)
+
+        assert sorted(cancelled) == paths[:3]
+
+    async def test_get_all_diffs_splits_per_file(self, git_client, temp_git_repo):
+        """Test that one combined diff is split into per-file sections."""
+        (temp_git_repo / "README.md").write_text("# Changed\n")
+        (temp_git_repo / "src" / "main.py").write_text("print('changed')\n")
+
+        diffs = await git_client.get_all_diffs(temp_git_repo)
+
+        assert sorted(diffs) == ["README.md", "src/main.py"]
+        assert diffs["README.md"].startswith("diff --git a/README.md b/README.md")
+        assert "src/main.py" not in diffs["README.md"]
+        assert diffs["src/main.py"] == await git_client.get_diff(
+            temp_git_repo, file_path="src/main.py"
+        )
+
+    async def test_get_all_diffs_with_unusual_paths(self, git_client, temp_git_repo):
+        """Test quoted, spaced and " b/" paths are keyed by their real names."""
+        paths = ["plain.py", "t\u00ebst.py", "has space.py", "x b/y.py", 'say "hi".py']
+        (temp_git_repo / "x b").mkdir()
+        for path in paths:
+            (temp_git_repo / path).write_text("one\n")
+        subprocess.run(["git", "add", "-A"], cwd=temp_git_repo, check=True)
+        subprocess.run(["git", "commit", "-qm", "Add"], cwd=temp_git_repo, check=True)
+        for path in paths:
+            (temp_git_repo / path).write_text(f"one\n{path}\n")
+
+        diffs = await git_client.get_all_diffs(temp_git_repo)
+
+        assert sorted(diffs) == sorted(paths)
+        for path in paths:
+            assert diffs[path].count("diff --git") == 1
+            assert f"+{path}" in diffs[path]
+
+    async def test_get_all_diffs_keys_renames_by_new_path(
+        self, git_client, temp_git_repo
+    ):
+        """Test that a staged rename is keyed by its post-image path."""
+        subprocess.run(
+            ["git", "mv", "README.md", "NOTES.md"], cwd=temp_git_repo, check=True
+        )
+        (temp_git_repo / "src" / "main.py").write_text("print('changed')\n")
+        subprocess.run(["git", "add", "-A"], cwd=temp_git_repo, check=True)
+
+        diffs = await git_client.get_all_diffs(temp_git_repo, staged=True)
+
+        assert sorted(diffs) == ["NOTES.md", "src/main.py"]
+        assert "rename to NOTES.md" in diffs["NOTES.md"]
+        assert "+print('changed')" in diffs["src/main.py"]
+
+    async def test_get_all_diffs_ignores_diff_config(self, git_client, temp_git_repo):
+        """Test that color and prefix settings don't change the split."""
+        for key, value in [("color.diff", "always"), ("diff.noprefix", "true")]:
+            subprocess.run(["git", "config", key, value], cwd=temp_git_repo, check=True)
+        (temp_git_repo / "README.md").write_text("# Changed\n")
+        (temp_git_repo / "src" / "main.py").write_text("print('changed')\n")
+
+        diffs = await git_client.get_all_diffs(temp_git_repo)
+
+        assert sorted(diffs) == ["README.md", "src/main.py"]
+        assert "\x1b[" not in diffs["README.md"]
+
+    async def test_get_all_diffs_merges_type_change(self, git_client, temp_git_repo):
+        """Test that a file replaced by a symlink stays one entry."""
+        (temp_git_repo / "README.md").unlink()
+        (temp_git_repo / "README.md").symlink_to("src/main.py")
+        (temp_git_repo / "src" / "main.py").write_text("print('changed')\n")
+
+        diffs = await git_client.get_all_diffs(temp_git_repo)
+
+        assert sorted(diffs) == ["README.md", "src/main.py"]
+        assert diffs["README.md"].count("diff --git") == 2
+        assert "new file mode 120000" in diffs["README.md"]
+        assert "+print('changed')" in diffs["src/main.py"]
+        assert "README.md" not in diffs["src/main.py"]
+
+    async def test_get_all_diffs_with_unmerged_path(self, git_client, temp_git_repo):
+        """Test that a conflicted file gets its combined diff."""
+
+        def git(*args):
+            subprocess.run(["git", *args], cwd=temp_git_repo, capture_output=True)
+
+        git("checkout", "-qb", "side")
+        (temp_git_repo / "README.md").write_text("side\tversion\n")
+        git("commit", "-qam", "Side")
+        git("checkout", "-q", "-")
+        (temp_git_repo / "README.md").write_text("main\tversion\n")
+        git("commit", "-qam", "Main")
+        git("merge", "side")
+        (temp_git_repo / "src" / "main.py").write_text("print('changed')\n")
+
+        diffs = await git_client.get_all_diffs(temp_git_repo)
+        staged = await git_client.get_all_diffs(temp_git_repo, staged=True)
+
+        assert sorted(diffs) == ["README.md", "src/main.py"]
+        assert diffs["README.md"].startswith("diff --cc README.md")
+        assert "+print('changed')" in diffs["src/main.py"]
+        assert staged == {}
+
+    async def test_get_all_diffs_without_changes(self, git_client, temp_git_repo):
+        """Test that a clean tree yields no diffs."""
+        assert await git_client.get_all_diffs(temp_git_repo) == {}
+
+
+@pytest.mark.unit
+@pytest.mark.git
+class TestGitClientCommits:
+    """Tests for GitClient commit listing."""
+
+    async def test_get_unpushed_commits_parses_special_characters(
+        self, git_client, temp_git_repo
+    ):
+        """Test that quotes and separators in commit data survive parsing."""
+        (temp_git_repo / "README.md").write_text("# Changed\n")
+        subprocess.run(
+            ["git", "commit", "-qam", 'Fix "quoted" {braces}, commas'],
+            cwd=temp_git_repo,
+            check=True,
+        )
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=temp_git_repo,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+
+        commits = await git_client.get_unpushed_commits(temp_git_repo)
+
+        assert [commit["message"] for commit in commits] == [
+            'Fix "quoted" {braces}, commas',
+            "Initial commit",
+        ]
+        assert commits[0]["sha"] == head
+        assert commits[0]["author"] == "Test User"
+        assert commits[0]["email"] == "test@example.com"
+
+
+@pytest.mark.unit
+@pytest.mark.git
+class TestGitClientStatus:
+    """Tests for GitClient.get_status."""
+
+    async def test_get_status_parses_entries(self, git_client, temp_git_repo):
+        """Test staged, unstaged, renamed and untracked entries."""
+        (temp_git_repo / "src" / "main.py").write_text("print('changed')\n")
+        (temp_git_repo / "new file.py").write_text("pass\n")
+        subprocess.run(
+            ["git", "mv", "README.md", "NOTES.md"], cwd=temp_git_repo, check=True
+        )
+
+        status = await git_client.get_status(temp_git_repo)
+
+        by_name = {entry["filename"]: entry for entry in status["files"]}
+        assert sorted(by_name) == ["NOTES.md", "new file.py", "src/main.py"]
+        assert by_name["NOTES.md"]["index_status"] == "R"
+        assert by_name["src/main.py"]["index_status"] is None
+        assert by_name["src/main.py"]["working_status"] == "M"
+        assert by_name["new file.py"]["status_code"] == "??"
+
+
+@pytest.mark.unit
+@pytest.mark.git
+class TestGitClientBranchInfo:
+    """Tests for GitClient.get_branch_info."""
+
+    async def test_get_branch_info_without_upstream(self, git_client, temp_git_repo):
+        """Test that a branch without upstream still reports HEAD."""
+        info = await git_client.get_branch_info(temp_git_repo)
+
+        assert info["current_branch"]
+        assert info["upstream"] is None
+        assert len(info["head_commit"]) == 40
+        assert (info["ahead"], info["behind"]) == (0, 0)
+
+    async def test_get_branch_info_with_upstream(self, git_client, temp_git_repo):
+        """Test that upstream tracking and ahead counts are reported."""
+        subprocess.run(["git", "branch", "base"], cwd=temp_git_repo, check=True)
+        subprocess.run(
+            ["git", "branch", "-q", "--set-upstream-to", "base"],
+            cwd=temp_git_repo,
+            check=True,
+        )
+        (temp_git_repo / "README.md").write_text("# Changed\n")
+        subprocess.run(
+            ["git", "commit", "-qam", "Ahead of base"], cwd=temp_git_repo, check=True
+        )
+
+        info = await git_client.get_branch_info(temp_git_repo)
+
+        assert info["upstream"] == "base"
+        assert info["current_branch"] != "base"
+        assert (info["ahead"], info["behind"]) == (1, 0)
+        assert len(info["head_commit"]) == 40
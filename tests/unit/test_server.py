@@ -1,50 +1,270 @@
 import asyncio
+import logging
+import sys
 
 import pytest
 
 from mcp_shared_lib.models.base.types import LogLevel
-from mcp_shared_lib.utils import logging_service
+from mcp_shared_lib.utils.logging_utils import LOG_BUFFER_SIZE, LoggingService
 
+if sys.version_info >= (3, 11):
 
-def test_get_logger_returns_logger_instance():
-    logger = logging_service.get_logger("test_logger")
+    async def wait_for(awaitable, timeout):
+        # asyncio.timeout bounds the current task without wrapping the
+        # awaitable in another one
+        async with asyncio.timeout(timeout):
+            return await awaitable
+
+else:
+    wait_for = asyncio.wait_for
+
+
+def test_get_logger_returns_logger_instance(svc):
+    logger = svc.get_logger("test_logger")
     assert logger.name == "test_logger"
+    assert svc.get_logger("test_logger") is logger
 
 
-@pytest.mark.asyncio
-async def test_set_level_and_notify(caplog):
-    # Set log level to DEBUG
-    await logging_service.set_level(LogLevel.DEBUG)
+class ListHandler(logging.Handler):
+    """Collect log records in memory."""
 
-    # Use caplog to capture logs
-    with caplog.at_level("DEBUG"):
-        await logging_service.notify(
-            "Test debug message", LogLevel.DEBUG, "test_notify_logger"
-        )
-        assert any("Test debug message" in record.message for record in caplog.records)
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
 
 
 @pytest.mark.asyncio
-async def test_subscribe_and_notify():
-    gen = logging_service.subscribe()
+async def test_set_level_and_notify(svc):
+    # Set log level to DEBUG
+    svc.set_level(LogLevel.DEBUG)
 
-    # Create a task to get the next message from the generator
-    # This ensures the generator starts executing and is waiting for messages
-    message_task = asyncio.create_task(gen.__anext__())
+    # Capture records directly on the logger under test
+    handler = ListHandler()
+    logger = svc.get_logger("test_notify_logger")
+    logger.addHandler(handler)
+    try:
+        await svc.notify("Test debug message", LogLevel.DEBUG, "test_notify_logger")
+    finally:
+        logger.removeHandler(handler)
 
-    # Give the generator a chance to start and reach the queue.get() call
-    await asyncio.sleep(0.01)
+    messages = {record.getMessage() for record in handler.records}
+    assert "Test debug message" in messages
 
-    # Now send the notification
-    await logging_service.notify(
-        "Test subscription", LogLevel.INFO, "test_subscribe_logger"
-    )
+
+@pytest.mark.asyncio
+async def test_subscribe_and_notify(svc):
+    subscription = svc.subscribe()
+
+    await svc.notify("Test subscription", LogLevel.INFO, "test_subscribe_logger")
 
     try:
         # Wait for the message with timeout
-        message = await asyncio.wait_for(message_task, timeout=2)
+        message = await wait_for(subscription.recv_one(), timeout=2)
         assert message["data"]["data"] == "Test subscription"
         assert message["data"]["level"] == LogLevel.INFO
         assert message["data"]["logger"] == "test_subscribe_logger"
     finally:
-        await gen.aclose()
+        await subscription.aclose()
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_skips_to_oldest_buffered_message():
+    service = LoggingService()
+    subscription = service.subscribe()
+    # Park the subscriber waiting for a message
+    message_task = asyncio.create_task(subscription.recv_one())
+    await asyncio.sleep(0)
+
+    # Overrun the buffer before the subscriber gets to run again
+    for i in range(LOG_BUFFER_SIZE + 5):
+        await service.notify(i, LogLevel.INFO, "test_ring_logger")
+
+    try:
+        first = await wait_for(message_task, timeout=2)
+        second = await wait_for(subscription.recv_one(), timeout=2)
+        assert first["data"]["data"] == 5
+        assert second["data"]["data"] == 6
+        assert subscription.dropped == 5
+    finally:
+        await subscription.aclose()
+
+
+@pytest.mark.asyncio
+async def test_notify_many_delivers_in_order():
+    service = LoggingService()
+    subscription = service.subscribe()
+
+    await service.notify_many(
+        [
+            ("first", LogLevel.INFO, "test_batch_logger"),
+            ("filtered", LogLevel.DEBUG, "test_batch_logger"),
+            ("second", LogLevel.WARNING, None),
+        ]
+    )
+
+    try:
+        first = await wait_for(subscription.recv_one(), timeout=2)
+        second = await wait_for(subscription.recv_one(), timeout=2)
+        assert first["data"]["data"] == "first"
+        assert first["data"]["logger"] == "test_batch_logger"
+        assert second["data"]["data"] == "second"
+        assert "logger" not in second["data"]
+    finally:
+        await subscription.aclose()
+
+
+@pytest.mark.asyncio
+async def test_subscription_iterates_until_closed():
+    service = LoggingService()
+    subscription = service.subscribe()
+    await service.notify_many(
+        [("one", LogLevel.INFO, None), ("two", LogLevel.INFO, None)]
+    )
+
+    received = []
+    async for message in subscription:
+        received.append(message["data"]["data"])
+        if len(received) == 2:
+            await subscription.aclose()
+
+    assert received == ["one", "two"]
+
+
+@pytest.mark.asyncio
+async def test_set_level_filters_by_mcp_level():
+    service = LoggingService()
+    service.set_level(LogLevel.NOTICE)
+    subscription = service.subscribe()
+    handler = ListHandler()
+    logger = service.get_logger("test_level_logger")
+    logger.addHandler(handler)
+    try:
+        await service.notify("below threshold", LogLevel.INFO, "test_level_logger")
+        await service.notify("at threshold", LogLevel.NOTICE, "test_level_logger")
+    finally:
+        logger.removeHandler(handler)
+
+    message = await wait_for(subscription.recv_one(), timeout=2)
+    assert message["data"]["data"] == "at threshold"
+    assert logger.level == logging.INFO + 5
+    assert [record.getMessage() for record in handler.records] == ["at threshold"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("level", [LogLevel.NOTICE, LogLevel.ALERT, LogLevel.EMERGENCY])
+async def test_levels_without_stdlib_counterpart_reach_handlers(level):
+    service = LoggingService()
+    service.set_level(level)
+    handler = ListHandler()
+    logger = service.get_logger("test_extra_level_logger")
+    logger.addHandler(handler)
+    try:
+        await service.notify("at threshold", level, "test_extra_level_logger")
+    finally:
+        logger.removeHandler(handler)
+
+    assert [record.levelno for record in handler.records] == [logger.level]
+
+
+@pytest.mark.asyncio
+async def test_notify_nowait_delivers_without_awaiting():
+    service = LoggingService()
+    subscription = service.subscribe()
+
+    service.notify_nowait("sync message", LogLevel.INFO, "test_nowait_logger")
+
+    message = await wait_for(subscription.recv_one(), timeout=2)
+    assert message["data"]["data"] == "sync message"
+
+
+@pytest.mark.asyncio
+async def test_subscribe_filters_by_logger_name():
+    service = LoggingService()
+    named = service.subscribe(logger_name="test_named_logger")
+    everything = service.subscribe()
+
+    service.notify_nowait("other", LogLevel.INFO, "test_other_logger")
+    await service.notify_many(
+        [
+            ("batched other", LogLevel.INFO, "test_other_logger"),
+            ("batched named", LogLevel.INFO, "test_named_logger"),
+        ]
+    )
+    service.notify_nowait("named", LogLevel.INFO, "test_named_logger")
+
+    named_data = [
+        (await wait_for(named.recv_one(), timeout=2))["data"]["data"] for _ in range(2)
+    ]
+    all_data = [
+        (await wait_for(everything.recv_one(), timeout=2))["data"]["data"]
+        for _ in range(4)
+    ]
+    assert named_data == ["batched named", "named"]
+    assert all_data == ["other", "batched other", "batched named", "named"]
+
+
+@pytest.mark.asyncio
+async def test_named_ring_released_when_subscribers_close():
+    service = LoggingService()
+    first = service.subscribe(logger_name="test_released_logger")
+    second = service.subscribe(logger_name="test_released_logger")
+
+    await first.aclose()
+    service.notify_nowait("still subscribed", LogLevel.INFO, "test_released_logger")
+    message = await wait_for(second.recv_one(), timeout=2)
+    assert message["data"]["data"] == "still subscribed"
+
+    await second.aclose()
+    assert "test_released_logger" not in service._named_rings
+
+    # Dropping an unclosed subscription releases its ring too
+    service.subscribe(logger_name="test_dropped_logger")
+    assert "test_dropped_logger" not in service._named_rings
+
+
+@pytest.mark.asyncio
+async def test_subscription_max_lag_drops_oldest():
+    service = LoggingService()
+    subscription = service.subscribe(max_lag=2)
+
+    await service.notify_many([(i, LogLevel.INFO, "test_lag_logger") for i in range(5)])
+
+    received = [
+        (await wait_for(subscription.recv_one(), timeout=2))["data"]["data"]
+        for _ in range(2)
+    ]
+    assert received == [3, 4]
+    assert subscription.dropped == 3
+
+
+@pytest.mark.asyncio
+async def test_shutdown_ends_subscriptions():
+    service = LoggingService()
+    waiting = service.subscribe()
+    named = service.subscribe(logger_name="test_shutdown_logger")
+    buffered = service.subscribe()
+    await service.notify("before shutdown", LogLevel.INFO, "test_shutdown_logger")
+
+    async def drain(subscription):
+        return [message async for message in subscription]
+
+    # Park one reader at the head of the ring before shutting down
+    await wait_for(waiting.recv_one(), timeout=2)
+    waiting_task = asyncio.create_task(drain(waiting))
+    await asyncio.sleep(0)
+
+    await service.shutdown()
+
+    assert await wait_for(waiting_task, timeout=2) == []
+    assert await wait_for(drain(named), timeout=2) == []
+    with pytest.raises(StopAsyncIteration):
+        await buffered.recv_one()
+
+    # The service keeps working for new subscribers
+    fresh = service.subscribe()
+    await service.notify("after shutdown", LogLevel.INFO, None)
+    message = await wait_for(fresh.recv_one(), timeout=2)
+    assert message["data"]["data"] == "after shutdown"
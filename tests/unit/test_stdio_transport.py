@@ -0,0 +1,77 @@
+"""Tests for the stdio transport."""
+
+import io
+from unittest.mock import Mock
+
+import pytest
+
+from mcp_shared_lib.transports import stdio
+from mcp_shared_lib.transports.config import TransportConfig
+from mcp_shared_lib.transports.stdio import HEALTH_CACHE_TTL, StdioTransport
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable replacement for time.monotonic."""
+    now = [100.0]
+    monkeypatch.setattr(stdio.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def transport(monkeypatch):
+    """Stdio transport with open in-memory standard streams."""
+    monkeypatch.setattr(stdio.sys, "stdin", io.StringIO())
+    monkeypatch.setattr(stdio.sys, "stdout", io.StringIO())
+    return StdioTransport(TransportConfig())
+
+
+@pytest.mark.unit
+class TestStdioHealthStatus:
+    """Tests for StdioTransport.get_health_status caching."""
+
+    def test_status_is_cached_within_ttl(self, transport, clock):
+        """Test that repeated calls within the TTL reuse the snapshot."""
+        transport.get_connection_info = Mock(return_value={"transport": "stdio"})
+
+        first = transport.get_health_status()
+        clock[0] += HEALTH_CACHE_TTL / 2
+        second = transport.get_health_status()
+
+        assert first == second
+        assert transport.get_connection_info.call_count == 1
+
+    def test_status_is_rebuilt_after_ttl(self, transport, clock):
+        """Test that an expired snapshot is recomputed."""
+        transport.get_connection_info = Mock(return_value={"transport": "stdio"})
+
+        transport.get_health_status()
+        clock[0] += HEALTH_CACHE_TTL
+        transport.get_health_status()
+
+        assert transport.get_connection_info.call_count == 2
+
+    def test_callers_cannot_mutate_cached_status(self, transport, clock):
+        """Test that returned statuses don't share state with the snapshot."""
+        status = transport.get_health_status()
+        status["status"] = "mutated"
+        status["connection_info"]["transport"] = "mutated"
+
+        cached = transport.get_health_status()
+
+        assert cached["status"] == "unhealthy"
+        assert cached["connection_info"] == {"transport": "stdio"}
+
+    def test_run_invalidates_cached_status(self, transport, clock):
+        """Test that starting and stopping the transport drops the snapshot."""
+        assert transport.get_health_status()["stdio_healthy"] is False
+        seen = []
+        server = Mock()
+        server.run.side_effect = lambda **_: seen.append(
+            transport.get_health_status()["stdio_healthy"]
+        )
+
+        transport.run(server)
+
+        assert seen == [True]
+        assert transport.get_health_status()["stdio_healthy"] is False
@@ -0,0 +1,120 @@
+"""Tests for transport configuration loading."""
+
+import os
+
+import pytest
+from pydantic import ValidationError
+
+from mcp_shared_lib.transports.config import TransportConfig
+
+HTTP_CONFIG_YAML = """\
+transport:
+  type: http
+  http:
+    host: 127.0.0.1
+    port: 9000
+    cors_origins:
+      - http://a
+  logging:
+    level: DEBUG
+"""
+
+
+@pytest.mark.unit
+@pytest.mark.config
+class TestTransportConfigFromFile:
+    """Tests for TransportConfig.from_file."""
+
+    def test_from_file_parses_sections(self, temp_dir):
+        """Test that transport sections are loaded from YAML."""
+        config_file = temp_dir / "transport.yaml"
+        config_file.write_text(HTTP_CONFIG_YAML)
+
+        config = TransportConfig.from_file(str(config_file))
+
+        assert config.type == "http"
+        assert config.http is not None
+        assert config.http.host == "127.0.0.1"
+        assert config.http.port == 9000
+        assert config.http.cors_origins == ("http://a",)
+        assert config.logging.level == "DEBUG"
+        assert config.websocket is None
+
+    def test_from_file_reloads_after_change(self, temp_dir):
+        """Test that a modified file is re-parsed rather than served from cache."""
+        config_file = temp_dir / "transport.yaml"
+        config_file.write_text(HTTP_CONFIG_YAML)
+        assert TransportConfig.from_file(str(config_file)).http.port == 9000
+
+        config_file.write_text(HTTP_CONFIG_YAML.replace("9000", "9100"))
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert TransportConfig.from_file(str(config_file)).http.port == 9100
+
+    def test_from_file_validates_sections(self, temp_dir):
+        """Test that section values are validated."""
+        config_file = temp_dir / "transport.yaml"
+        config_file.write_text(
+            HTTP_CONFIG_YAML.replace("host: 127.0.0.1", "host: [not, a, host]")
+        )
+
+        with pytest.raises(ValidationError):
+            TransportConfig.from_file(str(config_file))
+
+    def test_from_file_coerces_field_types(self, temp_dir):
+        """Test that YAML scalars are converted to the declared field types."""
+        config_file = temp_dir / "transport.yaml"
+        config_file.write_text(
+            HTTP_CONFIG_YAML.replace(
+                "port: 9000", 'port: "9000"\n    enable_health_check: "false"'
+            )
+        )
+
+        config = TransportConfig.from_file(str(config_file))
+
+        assert config.http.port == 9000
+        assert config.http.enable_health_check is False
+
+    @pytest.mark.parametrize(
+        ("old", "new"),
+        [
+            ("cors_origins:\n      - http://a", "cors_origins: http://a"),
+            ("level: DEBUG", "level: 10"),
+        ],
+    )
+    def test_from_file_rejects_mistyped_values(self, temp_dir, old, new):
+        """Test that values of the wrong shape are rejected, not passed through."""
+        config_file = temp_dir / "transport.yaml"
+        config_file.write_text(HTTP_CONFIG_YAML.replace(old, new))
+
+        with pytest.raises(ValidationError):
+            TransportConfig.from_file(str(config_file))
+
+
+@pytest.mark.unit
+@pytest.mark.config
+class TestTransportConfigFromEnv:
+    """Tests for TransportConfig.from_env."""
+
+    def test_from_env_parses_cors_origins(self, monkeypatch):
+        """Test that CORS origins are split and stripped of blanks."""
+        monkeypatch.setenv("MCP_TRANSPORT", "http")
+        monkeypatch.setenv("MCP_HTTP_PORT", "9001")
+        monkeypatch.setenv("MCP_HTTP_CORS_ORIGINS", "http://a, http://b,")
+
+        config = TransportConfig.from_env()
+
+        assert config.type == "http"
+        assert config.http.port == 9001
+        assert config.http.cors_origins == ("http://a", "http://b")
+        assert config.sse is None
+
+    def test_from_env_returns_frozen_config(self, monkeypatch):
+        """Test that loaded configs reject attribute assignment."""
+        monkeypatch.setenv("MCP_TRANSPORT", "stdio")
+
+        config = TransportConfig.from_env()
+
+        with pytest.raises(ValidationError):
+            config.type = "http"